@@ -5,9 +5,11 @@ Usage: python asset_pipeline_cli.py [options]
 """
 
 import argparse
+import json
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -20,6 +22,7 @@ class AssetPipelineCLI:
         self.glb_dir = self.project_root / "glb"
         self.pipeline_script = self.script_dir / "fbx_to_glb_pipeline.py"
         self.animation_combiner_script = self.script_dir / "fbx_animation_combiner.py"
+        self.entry_script = self.script_dir / "blender_entry.py"
     
     def discover_fbx_folders(self) -> List[Path]:
         """Dynamically discover all folders in the fbx directory"""
@@ -64,7 +67,24 @@ class AssetPipelineCLI:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
     
-    def run_conversion(self, folders: Optional[List[str]] = None, verbose: bool = False) -> None:
+    def run_blender(self, jobs: List[dict], verbose: bool = False) -> subprocess.CompletedProcess:
+        """Run jobs in a background Blender process, passing them as JSON on stdin"""
+        cmd = ["blender", "--background", "--python", str(self.entry_script), "--", "-"]
+        job_input = json.dumps({"jobs": jobs})
+        
+        if verbose:
+            print(f"Running command: {' '.join(cmd)}")
+            return subprocess.run(cmd, input=job_input, text=True)
+        
+        result = subprocess.run(cmd, input=job_input, capture_output=True, text=True)
+        if result.stdout:
+            print(result.stdout)
+        if result.stderr and result.returncode != 0:
+            print("Errors:", result.stderr)
+        return result
+    
+    def run_conversion(self, folders: Optional[List[str]] = None, verbose: bool = False,
+                       processes: int = 1) -> None:
         """Run the conversion pipeline"""
         if not self.check_blender():
             print("Error: Blender not found in PATH")
@@ -77,6 +97,10 @@ class AssetPipelineCLI:
             print(f"Error: Pipeline script not found: {self.pipeline_script}")
             return
         
+        if not self.entry_script.exists():
+            print(f"Error: Blender entry script not found: {self.entry_script}")
+            return
+        
         # Ensure GLB directory exists
         self.glb_dir.mkdir(exist_ok=True)
         
@@ -104,67 +128,28 @@ class AssetPipelineCLI:
         if verbose:
             print("Target folders:", [f.name for f in target_folders])
         
-        # Create a temporary script that processes only specific folders
-        temp_script_content = f'''#!/usr/bin/env python3
-import sys
-sys.path.append(r"{self.script_dir}")
-from fbx_to_glb_pipeline import process_fbx_folder, clear_scene
-from pathlib import Path
-
-def main():
-    project_root = Path(r"{self.project_root}")
-    glb_dir = project_root / "glb"
-    glb_dir.mkdir(exist_ok=True)
-    
-    target_folders = {[str(f) for f in target_folders]}
-    
-    successful = 0
-    failed = 0
-    
-    for folder_path in target_folders:
-        folder = Path(folder_path)
-        print(f"\\nProcessing: {{folder.name}}")
+        # Split the folders across independent Blender processes
+        process_count = max(1, min(processes, len(target_folders)))
+        chunks = [target_folders[i::process_count] for i in range(process_count)]
+        jobs = [
+            {
+                "task": "convert",
+                "folders": [str(f) for f in chunk],
+                "glb_dir": str(self.glb_dir),
+            }
+            for chunk in chunks
+        ]
         
-        if process_fbx_folder(folder, glb_dir):
-            successful += 1
-            print(f"✓ Successfully converted {{folder.name}}")
-        else:
-            failed += 1
-            print(f"✗ Failed to convert {{folder.name}}")
-    
-    print(f"\\n--- Summary ---")
-    print(f"Successful: {{successful}}")
-    print(f"Failed: {{failed}}")
-    print(f"Total: {{len(target_folders)}}")
-
-if __name__ == "__main__":
-    main()
-'''
+        if process_count > 1:
+            print(f"Running {process_count} Blender processes in parallel")
         
-        temp_script = self.project_root / "temp_pipeline.py"
-        try:
-            with open(temp_script, 'w', encoding='utf-8') as f:
-                f.write(temp_script_content)
-            
-            # Run Blender with the temporary script
-            cmd = ["blender", "--background", "--python", str(temp_script)]
-            
-            if verbose:
-                print(f"Running command: {' '.join(cmd)}")
-                result = subprocess.run(cmd)
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr and result.returncode != 0:
-                    print("Errors:", result.stderr)
-            
-            print("\nConversion completed!")
+        with ThreadPoolExecutor(max_workers=process_count) as executor:
+            results = list(executor.map(lambda job: self.run_blender([job], verbose), jobs))
         
-        finally:
-            # Clean up temporary script
-            if temp_script.exists():
-                temp_script.unlink()
+        if all(result.returncode == 0 for result in results):
+            print("\nConversion completed!")
+        else:
+            print("\nConversion completed with errors!")
     
     def combine_animations(self, base_character: str = "Ch20_nonPBR.fbx", verbose: bool = False) -> None:
         """Combine FBX animations into a single GLB file"""
@@ -179,6 +164,10 @@ if __name__ == "__main__":
             print(f"Error: Animation combiner script not found: {self.animation_combiner_script}")
             return
         
+        if not self.entry_script.exists():
+            print(f"Error: Blender entry script not found: {self.entry_script}")
+            return
+        
         if not self.fbx_anim_dir.exists():
             print(f"Error: FBX Animation directory not found: {self.fbx_anim_dir}")
             print(f"Please create the directory: {self.fbx_anim_dir}")
@@ -215,53 +204,18 @@ if __name__ == "__main__":
             for anim_file in animation_files:
                 print(f"  - {anim_file.name}")
         
-        # Create a temporary script that processes the animation combination
-        temp_script_content = f'''#!/usr/bin/env python3
-import sys
-sys.path.append(r"{self.script_dir}")
-from fbx_animation_combiner import process_fbx_animation_folder
-from pathlib import Path
-
-def main():
-    fbx_anim_dir = Path(r"{self.fbx_anim_dir}")
-    glb_dir = Path(r"{self.glb_dir}")
-    base_character = r"{base_character}"
-    
-    success = process_fbx_animation_folder(fbx_anim_dir, glb_dir, base_character)
-    if not success:
-        exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
-        
-        temp_script = self.project_root / "temp_animation_combiner.py"
-        try:
-            with open(temp_script, 'w', encoding='utf-8') as f:
-                f.write(temp_script_content)
-            
-            # Run Blender with the temporary script
-            cmd = ["blender", "--background", "--python", str(temp_script)]
-            
-            if verbose:
-                print(f"Running command: {' '.join(cmd)}")
-                result = subprocess.run(cmd)
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr and result.returncode != 0:
-                    print("Errors:", result.stderr)
-            
-            if result.returncode == 0:
-                print("\nAnimation combination completed successfully!")
-            else:
-                print("\nAnimation combination failed!")
+        job = {
+            "task": "combine_animations",
+            "fbx_anim_dir": str(self.fbx_anim_dir),
+            "glb_dir": str(self.glb_dir),
+            "base_character": base_character,
+        }
+        result = self.run_blender([job], verbose)
         
-        finally:
-            # Clean up temporary script
-            if temp_script.exists():
-                temp_script.unlink()
+        if result.returncode == 0:
+            print("\nAnimation combination completed successfully!")
+        else:
+            print("\nAnimation combination failed!")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -273,6 +227,7 @@ Examples:
   python asset_pipeline_cli.py --convert                           # Convert all assets
   python asset_pipeline_cli.py --convert male_casual               # Convert specific asset
   python asset_pipeline_cli.py --convert male_casual female_casual --verbose
+  python asset_pipeline_cli.py --convert --jobs 4                  # Convert all assets with 4 Blender processes
   python asset_pipeline_cli.py --combine-animations                # Combine animations (default base: Ch20_nonPBR.fbx)
   python asset_pipeline_cli.py --combine-animations --base-character MyChar.fbx --verbose
         """
@@ -291,6 +246,14 @@ Examples:
         help="Convert assets to GLB. If no folder names specified, converts all."
     )
     
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of Blender processes to run in parallel when converting (default: 1)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -317,7 +280,7 @@ Examples:
         cli.list_assets()
     elif args.convert is not None:
         folders = args.convert if args.convert else None
-        cli.run_conversion(folders, args.verbose)
+        cli.run_conversion(folders, args.verbose, args.jobs)
     elif args.combine_animations:
         cli.combine_animations(args.base_character, args.verbose)
     else:
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Blender Entry Point: Run pipeline jobs described in JSON
+Usage: blender --background --python blender_entry.py -- [JOB_FILE | -]
+
+The job description is read from JOB_FILE, or from stdin when JOB_FILE is
+omitted or '-'. It is either a single job, a list of jobs, or an object with
+a "jobs" list:
+
+    {"jobs": [
+        {"task": "convert", "folders": ["/path/to/fbx/hero"], "glb_dir": "/path/to/glb"},
+        {"task": "combine_animations", "fbx_anim_dir": "/path/to/fbxAnimation",
+         "glb_dir": "/path/to/glb", "base_character": "Ch20_nonPBR.fbx"}
+    ]}
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fbx_to_glb_pipeline import process_fbx_folder
+from fbx_animation_combiner import process_fbx_animation_folder
+
+def script_args(argv):
+    """Return the arguments passed after '--' on the Blender command line"""
+    if "--" in argv:
+        return argv[argv.index("--") + 1:]
+    return []
+
+def load_jobs(job_file):
+    """Load the job list from a JSON file, or stdin when job_file is '-'"""
+    if job_file == "-":
+        data = json.load(sys.stdin)
+    else:
+        with open(job_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("jobs", [data])
+    return data
+
+def run_convert(job):
+    """Convert each FBX folder in the job to GLB"""
+    glb_dir = Path(job["glb_dir"])
+    glb_dir.mkdir(exist_ok=True)
+    target_folders = job.get("folders", [])
+
+    successful = 0
+    failed = 0
+
+    for folder_path in target_folders:
+        folder = Path(folder_path)
+        print(f"\nProcessing: {folder.name}")
+
+        if process_fbx_folder(folder, glb_dir):
+            successful += 1
+            print(f"✓ Successfully converted {folder.name}")
+        else:
+            failed += 1
+            print(f"✗ Failed to convert {folder.name}")
+
+    print(f"\n--- Summary ---")
+    print(f"Successful: {successful}")
+    print(f"Failed: {failed}")
+    print(f"Total: {len(target_folders)}")
+    return failed == 0
+
+def run_combine_animations(job):
+    """Combine the animation files of the job into a single GLB"""
+    return process_fbx_animation_folder(
+        job["fbx_anim_dir"],
+        job["glb_dir"],
+        job.get("base_character", "Ch20_nonPBR.fbx")
+    )
+
+TASKS = {
+    "convert": run_convert,
+    "combine_animations": run_combine_animations,
+}
+
+def main():
+    """Run every job and report whether all of them succeeded"""
+    parser = argparse.ArgumentParser(
+        prog="blender --background --python blender_entry.py --",
+        description="Run asset pipeline jobs inside Blender"
+    )
+    parser.add_argument(
+        "job_file",
+        nargs="?",
+        default="-",
+        help="JSON job file, or '-' to read from stdin (default)"
+    )
+    args = parser.parse_args(script_args(sys.argv))
+
+    try:
+        jobs = load_jobs(args.job_file)
+    except (OSError, ValueError) as e:
+        print(f"Error reading jobs from {args.job_file}: {e}")
+        return False
+
+    success = True
+    for job in jobs:
+        task = TASKS.get(job.get("task"))
+        if task is None:
+            print(f"Error: Unknown task '{job.get('task')}'")
+            success = False
+            continue
+
+        try:
+            if not task(job):
+                success = False
+        except KeyError as e:
+            print(f"Error: Job '{job['task']}' is missing field {e}")
+            success = False
+
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    if not success:
+        sys.exit(1)